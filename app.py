@@ -1,8 +1,43 @@
+import io
+
 import streamlit as st
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 
+# Field dimensions in metres (assuming a 100x50 football field)
+FIELD_LENGTH = 100
+FIELD_WIDTH = 50
+
+
+@st.cache_data(max_entries=32)
+def render_field(coordinates):
+    """Render the field plot to PNG bytes, cached on the input points."""
+    # Create the plot
+    fig, ax = plt.subplots(figsize=(10, 5))
+    ax.set_xlim(0, FIELD_LENGTH)
+    ax.set_ylim(0, FIELD_WIDTH)
+
+    # Plot the coordinates in one call, keeping a distinct colour per point
+    colors = [f'C{idx % 10}' for idx in range(len(coordinates))]
+    ax.scatter(coordinates[:, 0], coordinates[:, 1], c=colors, s=100)
+
+    # Optionally, connect the points with lines (e.g., connecting the corners)
+    # Drawn as one polyline rather than one Line2D per segment
+    ax.plot(coordinates[:, 0], coordinates[:, 1], color='blue', linestyle='--', linewidth=2)
+
+    # Customize the plot to simulate a field
+    ax.set_title('Football Field with Generated Guidance Lines')
+    ax.set_xlabel('X Coordinate')
+    ax.set_ylabel('Y Coordinate')
+    ax.grid(True)
+
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=200, bbox_inches='tight')
+    plt.close(fig)
+    return buf.getvalue()
+
+
 # Streamlit UI
 st.title('Football Field Robotics: Guidance Line Generation')
 
@@ -16,47 +51,26 @@ st.write("""
 columns = ['Point', 'X Coordinate', 'Y Coordinate']
 data = {
     'Point': ['Top-Left Corner', 'Top-Right Corner', 'Bottom-Left Corner', 'Bottom-Right Corner', 'Center'],
-    'X Coordinate': [0, 100, 0, 100, 50],
-    'Y Coordinate': [0, 0, 50, 50, 25]
+    'X Coordinate': [0, FIELD_LENGTH, 0, FIELD_LENGTH, FIELD_LENGTH / 2],
+    'Y Coordinate': [0, 0, FIELD_WIDTH, FIELD_WIDTH, FIELD_WIDTH / 2]
 }
 df = pd.DataFrame(data)
 
 # Allow the user to modify the table
 st.subheader('Define Coordinates of Key Points on the Field')
-user_input_df = st.dataframe(df)
-
-# Optionally, let users modify the coordinates
-# In practice, Streamlit currently does not support editing the dataframe directly.
-# You can create input boxes for each field.
-
-# For simplicity, we will assume they are updated manually
-# If needed, create an input form instead for custom points
-
-# After user input, convert to numpy array
-coordinates = user_input_df[['X Coordinate', 'Y Coordinate']].to_numpy()
-
-# Create the plot
-fig, ax = plt.subplots(figsize=(10, 5))
-ax.set_xlim(0, 100)  # Assuming 100x50 football field
-ax.set_ylim(0, 50)
-
-# Plot the coordinates
-for idx, (x, y) in enumerate(coordinates):
-    ax.scatter(x, y, label=f"Point {df.iloc[idx]['Point']} ({x},{y})", s=100)
-
-# Optionally, connect the points with lines (e.g., connecting the corners)
-for i in range(len(coordinates) - 1):
-    x1, y1 = coordinates[i]
-    x2, y2 = coordinates[i + 1]
-    ax.plot([x1, x2], [y1, y2], color='blue', linestyle='--', linewidth=2)
+user_input_df = st.data_editor(
+    df,
+    hide_index=True,
+    column_config={
+        'X Coordinate': st.column_config.NumberColumn(min_value=0, max_value=FIELD_LENGTH, step=0.01, format='%.2f', required=True),
+        'Y Coordinate': st.column_config.NumberColumn(min_value=0, max_value=FIELD_WIDTH, step=0.01, format='%.2f', required=True),
+    },
+)
 
-# Customize the plot to simulate a field
-ax.set_title('Football Field with Generated Guidance Lines')
-ax.set_xlabel('X Coordinate')
-ax.set_ylabel('Y Coordinate')
-ax.grid(True)
+# After user input, convert to numpy array in a single pass
+coordinates = user_input_df[['X Coordinate', 'Y Coordinate']].to_numpy(dtype=float)
 
 # Show the plot in Streamlit
-st.pyplot(fig)
+st.image(render_field(coordinates))
 
 # Add further instructions for generating more complex guidance lines